@@ -66,6 +66,13 @@ LIFE_INSURANCE_CONFIG = {
         "Semi-Annual",
         "Annual"
     ],
+    # Months of premium collected per payment, by payment frequency
+    "payment_frequency_months": {
+        "Monthly": 1,
+        "Quarterly": 3,
+        "Semi-Annual": 6,
+        "Annual": 12
+    },
     "coverage_ranges": {
         "min": 25000,
         "max": 2000000
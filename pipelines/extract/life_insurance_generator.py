@@ -2,27 +2,77 @@
 Life Insurance Data Generator using Faker
 Generates realistic life insurance journey data: Customer -> Quote -> Application -> Policy -> Claims
 """
-import json
+import math
+import os
 import random
 from datetime import datetime, timedelta, timezone
+from itertools import accumulate, chain
+from multiprocessing import Pool
 from pathlib import Path
+from typing import Callable
 import sys
 
 from faker import Faker
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.settings import QA_DIR, LIFE_INSURANCE_CONFIG
+from pipelines.io_utils import dumps_json, ensure_dir, write_json_records
 
 fake = Faker()
 Faker.seed(42)
 random.seed(42)
 
+GENDERS = ("Male", "Female")
+EMPLOYMENT_STATUSES = ("Employed", "Self-Employed", "Retired", "Unemployed")
+COVERAGE_AMOUNTS = (25000, 50000, 100000, 250000, 500000, 750000, 1000000, 1500000, 2000000)
+RISK_CATEGORIES = ("Low", "Medium", "High")
+QUOTE_SOURCES = ("Web", "Phone", "Agent", "Referral")
+CLAIM_OUTCOMES = ("Approved", "Paid", "Denied", "Closed")
+BENEFICIARY_RELATIONSHIPS = ("Spouse", "Child", "Parent", "Sibling", "Other")
+DENIAL_REASONS = (
+    "Policy lapsed",
+    "Exclusion period",
+    "Fraud suspected",
+    "Documentation incomplete",
+)
+
+# Premium rating factor per product type (unknown products rate at 1)
+PRODUCT_FACTORS = {
+    "Term Life": 0.8,
+    "Whole Life": 1.5,
+    "Universal Life": 1.3,
+    "Variable Life": 1.4,
+    "Final Expense": 2.0,
+}
+
+# Cumulative weights for per-record draws, so random.choices doesn't rebuild them each call
+POLICY_STATUS_CUM_WEIGHTS = tuple(accumulate([70, 10, 5, 10, 5]))
+CLAIM_TYPE_CUM_WEIGHTS = tuple(accumulate([60, 20, 15, 5]))
+CLAIM_OUTCOME_CUM_WEIGHTS = tuple(accumulate([20, 50, 10, 20]))
+
+# Below this many customers, worker startup costs more than it saves
+PARALLEL_MIN_CUSTOMERS = 2000
+# Base seed for worker chunks; each chunk adds its start index
+CUSTOMER_SEED = 42
+# Values pre-generated for each pooled Faker provider
+FAKER_POOL_SIZE = 5000
+# Pool only runs drawing more than this many values. Sampling a pool repeats
+# values: n draws give about FAKER_POOL_SIZE * (1 - e^(-n / FAKER_POOL_SIZE))
+# distinct ones, so near the pool size a third of the variety is lost to save a
+# few hundred Faker calls. Past 4x the pool size the time saved is worth it.
+FAKER_POOL_MIN_DRAWS = 4 * FAKER_POOL_SIZE
+# Customer providers slow enough to pool (40-70 us per call)
+CUSTOMER_POOLED_PROVIDERS = ("first_name", "last_name", "street_address", "city")
+
 
 class LifeInsuranceGenerator:
     """Generates realistic life insurance data with proper relationships"""
 
-    def __init__(self, num_customers: int = 100):
+    def __init__(self, num_customers: int = 100, workers: int = 1):
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
         self.num_customers = num_customers
+        self.workers = workers
         self.config = LIFE_INSURANCE_CONFIG
         self.customers = []
         self.agents = []
@@ -30,6 +80,10 @@ class LifeInsuranceGenerator:
         self.applications = []
         self.policies = []
         self.claims = []
+        # Parsed dates keyed by record ID, so later phases don't re-parse ISO strings
+        self._quote_dates = {}
+        self._decision_dates = {}
+        self._effective_dates = {}
 
     def generate_all(self) -> dict:
         """Generate all entities in dependency order"""
@@ -84,106 +138,98 @@ class LifeInsuranceGenerator:
         return agents
 
     def generate_customers(self) -> list[dict]:
-        """Generate customer records"""
-        customers = []
-        for i in range(self.num_customers):
-            dob = fake.date_of_birth(minimum_age=18, maximum_age=75)
-            age = (datetime.now().date() - dob).days // 365
-
-            customer = {
-                "Customer_ID__c": f"CUST-{i+1:05d}",
-                "First_Name__c": fake.first_name(),
-                "Last_Name__c": fake.last_name(),
-                "Email__c": fake.email(),
-                "Phone__c": fake.phone_number(),
-                "Date_of_Birth__c": dob.isoformat(),
-                "Age__c": age,
-                "Gender__c": random.choice(["Male", "Female"]),
-                "Address__c": fake.street_address(),
-                "City__c": fake.city(),
-                "State__c": fake.state_abbr(),
-                "Zip_Code__c": fake.zipcode(),
-                "Smoker__c": random.random() < 0.25,
-                "Annual_Income__c": random.randint(30000, 500000),
-                "Employment_Status__c": random.choice(
-                    ["Employed", "Self-Employed", "Retired", "Unemployed"]
-                ),
-                "Occupation__c": fake.job(),
-                "Created_Date__c": fake.date_between(
-                    start_date="-2y", end_date="today"
-                ).isoformat(),
-            }
-            customers.append(customer)
+        """Generate customer records, fanning out to worker processes if configured"""
+        if self.workers > 1 and self.num_customers >= PARALLEL_MIN_CUSTOMERS:
+            chunk_size = math.ceil(self.num_customers / self.workers)
+            # Pools are built once here so every chunk samples the same values
+            pools = build_customer_pools(self.num_customers)
+            tasks = [
+                (
+                    start,
+                    min(chunk_size, self.num_customers - start),
+                    CUSTOMER_SEED + start,
+                    pools,
+                )
+                for start in range(0, self.num_customers, chunk_size)
+            ]
+            # Chunking follows --workers; processes are capped at the CPUs available
+            processes = min(self.workers, os.cpu_count() or 1, len(tasks))
+            with Pool(processes=processes) as pool:
+                chunks = pool.map(_generate_customer_chunk, tasks)
+            customers = list(chain.from_iterable(chunks))
+        else:
+            customers = generate_customer_records(0, self.num_customers)
         self.customers = customers
         return customers
 
     def generate_quotes(self) -> list[dict]:
         """Generate quotes - each customer gets 1-3 quotes"""
         quotes = []
+        quote_dates = {}
         quote_counter = 0
 
-        for customer in self.customers:
-            num_quotes = random.choices([1, 2, 3], weights=[60, 30, 10])[0]
+        # Draw every per-quote random field for the phase up front
+        quote_counts = random.choices([1, 2, 3], weights=[60, 30, 10], k=len(self.customers))
+        n = sum(quote_counts)
+        product_types = random.choices(self.config["product_types"], k=n)
+        coverage_amounts = random.choices(COVERAGE_AMOUNTS, k=n)
+        agents = random.choices(self.agents, k=n)
+        term_years = random.choices(self.config["term_years_options"], k=n)
+        statuses = random.choices(self.config["quote_statuses"], k=n)
+        risk_categories = random.choices(RISK_CATEGORIES, k=n)
+        sources = random.choices(QUOTE_SOURCES, k=n)
+
+        for customer, num_quotes in zip(self.customers, quote_counts):
+            # Rating factors depend only on the customer, not the quote
+            age = customer["Age__c"]
+            age_factor = 1 + (age - 30) * 0.02 if age > 30 else 1
+            smoker_factor = 1.5 if customer["Smoker__c"] else 1
+            customer_created = datetime.fromisoformat(customer["Created_Date__c"]).date()
 
             for _ in range(num_quotes):
+                i = quote_counter
                 quote_counter += 1
-                product_type = random.choice(self.config["product_types"])
+                product_type = product_types[i]
 
-                coverage_amount = random.choice(
-                    [25000, 50000, 100000, 250000, 500000, 750000, 1000000, 1500000, 2000000]
-                )
+                coverage_amount = coverage_amounts[i]
 
-                age = customer["Age__c"]
-                smoker = customer["Smoker__c"]
                 base_rate = coverage_amount * 0.001
-                age_factor = 1 + (age - 30) * 0.02 if age > 30 else 1
-                smoker_factor = 1.5 if smoker else 1
-                product_factors = {
-                    "Term Life": 0.8,
-                    "Whole Life": 1.5,
-                    "Universal Life": 1.3,
-                    "Variable Life": 1.4,
-                    "Final Expense": 2.0,
-                }
                 premium = (
                     base_rate
                     * age_factor
                     * smoker_factor
-                    * product_factors.get(product_type, 1)
+                    * PRODUCT_FACTORS.get(product_type, 1)
                 )
 
-                customer_created = datetime.fromisoformat(customer["Created_Date__c"]).date()
                 quote_date = fake.date_between(start_date=customer_created, end_date="today")
                 expiry_date = quote_date + timedelta(days=30)
 
-                agent = random.choice(self.agents)
-
                 quote = {
                     "Quote_ID__c": f"QUO-{quote_counter:06d}",
                     "Customer_ID__c": customer["Customer_ID__c"],
-                    "Agent_ID__c": agent["Agent_ID__c"],
+                    "Agent_ID__c": agents[i]["Agent_ID__c"],
                     "Product_Type__c": product_type,
                     "Coverage_Amount__c": coverage_amount,
                     "Premium_Monthly__c": round(premium, 2),
-                    "Term_Years__c": (
-                        random.choice(self.config["term_years_options"])
-                        if product_type == "Term Life"
-                        else None
-                    ),
-                    "Status__c": random.choice(self.config["quote_statuses"]),
+                    "Term_Years__c": term_years[i] if product_type == "Term Life" else None,
+                    "Status__c": statuses[i],
                     "Created_Date__c": quote_date.isoformat(),
                     "Expiry_Date__c": expiry_date.isoformat(),
-                    "Risk_Category__c": random.choice(["Low", "Medium", "High"]),
-                    "Source__c": random.choice(["Web", "Phone", "Agent", "Referral"]),
+                    "Risk_Category__c": risk_categories[i],
+                    "Source__c": sources[i],
                 }
                 quotes.append(quote)
+                quote_dates[quote["Quote_ID__c"]] = quote_date
 
         self.quotes = quotes
+        self._quote_dates = quote_dates
         return quotes
 
     def generate_applications(self) -> list[dict]:
         """Generate applications - ~30% of quotes convert to applications"""
         applications = []
+        decision_dates = {}
+        today = datetime.now().date()
         conversion_rate = self.config["conversion_rates"]["quote_to_application"]
 
         converted_quotes = [q for q in self.quotes if q["Status__c"] == "Converted"]
@@ -196,25 +242,28 @@ class LifeInsuranceGenerator:
             )
             converted_quotes.extend(additional)
 
+        n = len(converted_quotes)
+        underwriting_statuses = random.choices(
+            self.config["underwriting_statuses"], weights=[15, 15, 50, 15, 5], k=n
+        )
+        health_classes = random.choices(
+            self.config["health_classes"], weights=[10, 25, 30, 25, 10], k=n
+        )
+
         for idx, quote in enumerate(converted_quotes):
-            quote_date = datetime.fromisoformat(quote["Created_Date__c"]).date()
+            quote_date = self._quote_dates[quote["Quote_ID__c"]]
             app_date = quote_date + timedelta(days=random.randint(1, 14))
-            if app_date > datetime.now().date():
-                app_date = datetime.now().date()
-
-            underwriting_status = random.choices(
-                self.config["underwriting_statuses"], weights=[15, 15, 50, 15, 5]
-            )[0]
+            if app_date > today:
+                app_date = today
 
-            health_class = random.choices(
-                self.config["health_classes"], weights=[10, 25, 30, 25, 10]
-            )[0]
+            underwriting_status = underwriting_statuses[idx]
+            health_class = health_classes[idx]
 
             decision_date = None
             if underwriting_status in ["Approved", "Declined"]:
                 decision_date = app_date + timedelta(days=random.randint(7, 30))
-                if decision_date > datetime.now().date():
-                    decision_date = datetime.now().date()
+                if decision_date > today:
+                    decision_date = today
 
             application = {
                 "Application_ID__c": f"APP-{idx+1:06d}",
@@ -238,13 +287,18 @@ class LifeInsuranceGenerator:
                 "Notes__c": fake.paragraph() if random.random() > 0.7 else None,
             }
             applications.append(application)
+            if decision_date:
+                decision_dates[application["Application_ID__c"]] = decision_date
 
         self.applications = applications
+        self._decision_dates = decision_dates
         return applications
 
     def generate_policies(self) -> list[dict]:
         """Generate policies - ~70% of approved applications become policies"""
         policies = []
+        effective_dates = {}
+        today = datetime.now().date()
         conversion_rate = self.config["conversion_rates"]["application_to_policy"]
 
         approved_apps = [
@@ -254,18 +308,20 @@ class LifeInsuranceGenerator:
         apps_to_convert = random.sample(
             approved_apps, min(num_to_convert, len(approved_apps))
         )
+        beneficiary_name = _pooled(fake.name, _faker_pool(fake.name, len(apps_to_convert)))
+
+        quotes_by_id = {q["Quote_ID__c"]: q for q in self.quotes}
+        payment_months = self.config["payment_frequency_months"]
 
         for app in apps_to_convert:
-            quote = next(
-                (q for q in self.quotes if q["Quote_ID__c"] == app["Quote_ID__c"]), None
-            )
+            quote = quotes_by_id.get(app["Quote_ID__c"])
             if not quote:
                 continue
 
-            decision_date = datetime.fromisoformat(app["Decision_Date__c"]).date()
+            decision_date = self._decision_dates[app["Application_ID__c"]]
             effective_date = decision_date + timedelta(days=random.randint(1, 14))
-            if effective_date > datetime.now().date():
-                effective_date = datetime.now().date()
+            if effective_date > today:
+                effective_date = today
 
             if quote["Term_Years__c"]:
                 expiry_date = effective_date + timedelta(
@@ -275,29 +331,14 @@ class LifeInsuranceGenerator:
                 expiry_date = effective_date + timedelta(days=365 * 99)
 
             payment_freq = random.choice(self.config["payment_frequencies"])
-            premium_multipliers = {
-                "Monthly": 1,
-                "Quarterly": 3,
-                "Semi-Annual": 6,
-                "Annual": 12,
-            }
-
-            policy_age_days = (datetime.now().date() - effective_date).days
+            policy_age_days = (today - effective_date).days
             if policy_age_days < 90:
                 status = "Active"
             else:
                 status = random.choices(
-                    self.config["policy_statuses"], weights=[70, 10, 5, 10, 5]
+                    self.config["policy_statuses"], cum_weights=POLICY_STATUS_CUM_WEIGHTS
                 )[0]
 
-            beneficiary_relationships = [
-                "Spouse",
-                "Child",
-                "Parent",
-                "Sibling",
-                "Other",
-            ]
-
             policy = {
                 "Policy_ID__c": f"POL-{len(policies)+1:06d}",
                 "Application_ID__c": app["Application_ID__c"],
@@ -308,11 +349,11 @@ class LifeInsuranceGenerator:
                 "Expiry_Date__c": expiry_date.isoformat(),
                 "Coverage_Amount__c": quote["Coverage_Amount__c"],
                 "Premium_Amount__c": round(
-                    quote["Premium_Monthly__c"] * premium_multipliers[payment_freq], 2
+                    quote["Premium_Monthly__c"] * payment_months[payment_freq], 2
                 ),
                 "Payment_Frequency__c": payment_freq,
-                "Beneficiary_Name__c": fake.name(),
-                "Beneficiary_Relationship__c": random.choice(beneficiary_relationships),
+                "Beneficiary_Name__c": beneficiary_name(),
+                "Beneficiary_Relationship__c": random.choice(BENEFICIARY_RELATIONSHIPS),
                 "Status__c": status,
                 "Cash_Value__c": (
                     self._calculate_cash_value(
@@ -325,39 +366,37 @@ class LifeInsuranceGenerator:
                     else 0
                 ),
                 "Last_Payment_Date__c": (
-                    (
-                        datetime.now().date() - timedelta(days=random.randint(1, 30))
-                    ).isoformat()
+                    (today - timedelta(days=random.randint(1, 30))).isoformat()
                     if status == "Active"
                     else None
                 ),
             }
             policies.append(policy)
+            effective_dates[policy["Policy_ID__c"]] = effective_date
 
         self.policies = policies
+        self._effective_dates = effective_dates
         return policies
 
     def generate_claims(self) -> list[dict]:
         """Generate claims - ~2% of policies have claims annually"""
         claims = []
+        today = datetime.now().date()
         claim_rate = self.config["conversion_rates"]["policy_to_claim_annual"]
 
         eligible_policies = []
         for policy in self.policies:
-            if policy["Status__c"] in ["Active", "Paid Up"]:
-                policy_age_years = (
-                    datetime.now().date()
-                    - datetime.fromisoformat(policy["Effective_Date__c"]).date()
-                ).days / 365
+            if policy["Status__c"] in ("Active", "Paid Up"):
+                effective_date = self._effective_dates[policy["Policy_ID__c"]]
+                policy_age_years = (today - effective_date).days / 365
                 if random.random() < (claim_rate * max(1, policy_age_years)):
-                    eligible_policies.append(policy)
+                    eligible_policies.append((policy, effective_date))
 
-        for policy in eligible_policies:
-            effective_date = datetime.fromisoformat(policy["Effective_Date__c"]).date()
+        for policy, effective_date in eligible_policies:
             filed_date = fake.date_between(start_date=effective_date, end_date="today")
 
             claim_type = random.choices(
-                self.config["claim_types"], weights=[60, 20, 15, 5]
+                self.config["claim_types"], cum_weights=CLAIM_TYPE_CUM_WEIGHTS
             )[0]
 
             if claim_type == "Death Benefit":
@@ -372,26 +411,19 @@ class LifeInsuranceGenerator:
             processing_days = random.randint(15, 90)
             processed_date = filed_date + timedelta(days=processing_days)
 
-            if processed_date > datetime.now().date():
+            if processed_date > today:
                 processed_date = None
                 status = random.choice(["Filed", "Under Review"])
                 payout_amount = None
             else:
                 status = random.choices(
-                    ["Approved", "Paid", "Denied", "Closed"], weights=[20, 50, 10, 20]
+                    CLAIM_OUTCOMES, cum_weights=CLAIM_OUTCOME_CUM_WEIGHTS
                 )[0]
                 if status == "Denied":
                     payout_amount = 0
                 else:
                     payout_amount = round(claim_amount * random.uniform(0.95, 1.0), 2)
 
-            denial_reasons = [
-                "Policy lapsed",
-                "Exclusion period",
-                "Fraud suspected",
-                "Documentation incomplete",
-            ]
-
             claim = {
                 "Claim_ID__c": f"CLM-{len(claims)+1:06d}",
                 "Policy_ID__c": policy["Policy_ID__c"],
@@ -406,7 +438,7 @@ class LifeInsuranceGenerator:
                 ),
                 "Payout_Amount__c": payout_amount,
                 "Denial_Reason__c": (
-                    random.choice(denial_reasons) if status == "Denied" else None
+                    random.choice(DENIAL_REASONS) if status == "Denied" else None
                 ),
                 "Adjuster_ID__c": f"ADJ-{random.randint(1, 50):05d}",
                 "Notes__c": fake.paragraph() if random.random() > 0.7 else None,
@@ -428,38 +460,153 @@ class LifeInsuranceGenerator:
         return round(base_value * (1 + growth_rate) ** years, 2)
 
 
-def save_to_qa(data: list[dict], entity_name: str) -> Path:
-    """Save generated data to QA layer"""
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    output_dir = QA_DIR / entity_name
-    output_dir.mkdir(parents=True, exist_ok=True)
+def _faker_pool(provider: Callable[[], str], count: int) -> list[str] | None:
+    """
+    Pre-generate values for a slow Faker provider
+
+    Args:
+        provider: Bound Faker provider method, e.g. fake.first_name
+        count: Number of values the run draws from this provider
+
+    Returns:
+        FAKER_POOL_SIZE values when count exceeds FAKER_POOL_MIN_DRAWS,
+        otherwise None (smaller runs call Faker directly)
+    """
+    if count <= FAKER_POOL_MIN_DRAWS:
+        return None
+    return [provider() for _ in range(FAKER_POOL_SIZE)]
+
+
+def _pooled(provider: Callable[[], str], pool: list[str] | None) -> Callable[[], str]:
+    """Return a zero-argument draw that samples `pool`, or calls `provider` if there is none"""
+    if pool is None:
+        return provider
+    return lambda: random.choice(pool)
+
+
+def build_customer_pools(run_size: int) -> dict[str, list[str] | None]:
+    """Pool the slow customer providers for a run of `run_size` customers"""
+    return {
+        name: _faker_pool(getattr(fake, name), run_size)
+        for name in CUSTOMER_POOLED_PROVIDERS
+    }
+
+
+def generate_customer_records(
+    start: int, count: int, pools: dict[str, list[str] | None] | None = None
+) -> list[dict]:
+    """
+    Generate `count` customer records numbered from CUST-{start+1}
+
+    Args:
+        start: Index of the first customer
+        count: Number of customers to generate
+        pools: Provider pools for the whole run, from build_customer_pools.
+            Worker chunks receive the parent's pools so the worker count
+            doesn't change the dataset. Built from count when omitted.
+    """
+    if pools is None:
+        pools = build_customer_pools(count)
+    first_name = _pooled(fake.first_name, pools["first_name"])
+    last_name = _pooled(fake.last_name, pools["last_name"])
+    street_address = _pooled(fake.street_address, pools["street_address"])
+    city = _pooled(fake.city, pools["city"])
+
+    customers = []
+    today = datetime.now().date()
+    for i in range(start, start + count):
+        dob = fake.date_of_birth(minimum_age=18, maximum_age=75)
+        age = (today - dob).days // 365
+
+        customer = {
+            "Customer_ID__c": f"CUST-{i+1:05d}",
+            "First_Name__c": first_name(),
+            "Last_Name__c": last_name(),
+            "Email__c": fake.email(),
+            "Phone__c": fake.phone_number(),
+            "Date_of_Birth__c": dob.isoformat(),
+            "Age__c": age,
+            "Gender__c": random.choice(GENDERS),
+            "Address__c": street_address(),
+            "City__c": city(),
+            "State__c": fake.state_abbr(),
+            "Zip_Code__c": fake.zipcode(),
+            "Smoker__c": random.random() < 0.25,
+            "Annual_Income__c": random.randint(30000, 500000),
+            "Employment_Status__c": random.choice(EMPLOYMENT_STATUSES),
+            "Occupation__c": fake.job(),
+            "Created_Date__c": fake.date_between(
+                start_date="-2y", end_date="today"
+            ).isoformat(),
+        }
+        customers.append(customer)
+    return customers
+
+
+def _generate_customer_chunk(task: tuple[int, int, int, dict]) -> list[dict]:
+    """Worker entry point: reseed this process, then generate one chunk of customers"""
+    start, count, seed, pools = task
+    Faker.seed(seed)
+    random.seed(seed)
+    return generate_customer_records(start, count, pools=pools)
+
+
+def save_to_qa(
+    data: list[dict],
+    entity_name: str,
+    pretty: bool = False,
+    extracted_at: datetime | None = None,
+) -> Path:
+    """
+    Save generated data to QA layer
+
+    Args:
+        data: Records to save
+        entity_name: Entity type, used for the QA subdirectory and filename
+        pretty: Indent every field for debugging instead of writing one
+            compact record per line
+        extracted_at: Extraction time for the filename and metadata
+            (defaults to now)
+
+    Returns:
+        Path of the written QA file
+    """
+    if extracted_at is None:
+        extracted_at = datetime.now(timezone.utc)
+    timestamp = extracted_at.strftime("%Y%m%d_%H%M%S")
+    output_dir = ensure_dir(QA_DIR / entity_name)
 
     output_file = output_dir / f"{entity_name}_{timestamp}.json"
 
-    output_data = {
-        "metadata": {
-            "source": "Life Insurance Data Generator (Faker)",
-            "extracted_at": datetime.now(timezone.utc).isoformat(),
-            "record_count": len(data),
-            "layer": "QA",
-        },
-        "data": data,
+    metadata = {
+        "source": "Life Insurance Data Generator (Faker)",
+        "extracted_at": extracted_at.isoformat(),
+        "record_count": len(data),
+        "layer": "QA",
     }
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2)
+    if pretty:
+        output_file.write_bytes(dumps_json({"metadata": metadata, "data": data}))
+    else:
+        write_json_records(output_file, metadata, data)
 
     return output_file
 
 
-def run_extraction(num_customers: int = 100) -> dict[str, Path]:
+def run_extraction(
+    num_customers: int = 100, pretty: bool = False, workers: int = 1
+) -> dict[str, Path]:
     """Run the full extraction process"""
-    generator = LifeInsuranceGenerator(num_customers)
+    generator = LifeInsuranceGenerator(num_customers, workers=workers)
     all_data = generator.generate_all()
 
+    # One timestamp per run so all entity files carry the same stamp
+    extracted_at = datetime.now(timezone.utc)
     output_files = {}
     for entity_name, data in all_data.items():
-        output_file = save_to_qa(data, entity_name)
+        output_file = save_to_qa(
+            data, entity_name, pretty=pretty, extracted_at=extracted_at
+        )
         output_files[entity_name] = output_file
         print(f"Saved {entity_name} to: {output_file}")
 
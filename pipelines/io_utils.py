@@ -0,0 +1,103 @@
+"""
+Shared I/O helpers for the Life Insurance Data Lake pipelines
+Serializes with orjson when it is installed, falling back to the stdlib json module
+"""
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# How write_json_records lays out the metadata line
+_METADATA_PREFIX = b'  "metadata": '
+
+
+@lru_cache(maxsize=None)
+def ensure_dir(path: Path) -> Path:
+    """Create a directory (and parents) once per process and return it"""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _loads(raw: bytes):
+    """Decode UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_json(path: Path):
+    """Load a JSON document from disk in a single read"""
+    return _loads(path.read_bytes())
+
+
+def read_json_metadata(path: Path) -> dict | None:
+    """
+    Read only the "metadata" object of a {"metadata": ..., "data": [...]} document
+
+    write_json_records keeps the compact metadata alone on the second line,
+    so only the head of the file is read. Other layouts fall back to a full
+    parse. Decode errors propagate as ValueError, I/O errors as OSError.
+    """
+    with open(path, "rb") as f:
+        first_line = f.readline()
+        metadata_line = f.readline()
+    if (
+        first_line == b"{\n"
+        and metadata_line.startswith(_METADATA_PREFIX)
+        and metadata_line.endswith(b",\n")
+    ):
+        metadata = _loads(metadata_line[len(_METADATA_PREFIX) : -2])
+    else:
+        document = read_json(path)
+        metadata = document.get("metadata") if isinstance(document, dict) else None
+    return metadata if isinstance(metadata, dict) else None
+
+
+def dumps_json(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes indented by two spaces"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _dumps_compact(data) -> bytes:
+    """Serialize data to compact single-line UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def write_json_records(path: Path, metadata: dict, records: list[dict]) -> None:
+    """
+    Write a {"metadata": ..., "data": [...]} document with one record per line
+
+    Records are encoded and written one at a time, so the serialized
+    payload is never held in memory as a single string. The output is
+    still a regular JSON document and loads with json.load. It is written
+    to a sibling .tmp file and moved into place, so readers never see a
+    partially written document.
+
+    Args:
+        path: Destination file
+        metadata: Metadata object written before the records
+        records: Records written to the "data" array
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(b"{\n" + _METADATA_PREFIX)
+            f.write(_dumps_compact(metadata))
+            f.write(b',\n  "data": [')
+            for idx, record in enumerate(records):
+                f.write(b"\n    " if idx == 0 else b",\n    ")
+                f.write(_dumps_compact(record))
+            f.write(b"\n  ]\n}\n" if records else b"]\n}\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
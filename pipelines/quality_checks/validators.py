@@ -2,18 +2,20 @@
 Data Quality Validators for Life Insurance Data Lake
 Validates data quality between QA and PROD layers
 """
-import json
+import re
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-import sys
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.settings import QA_THRESHOLDS, LIFE_INSURANCE_CONFIG
+from pipelines.io_utils import read_json
 
+EMAIL_PATTERN = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
 
-@dataclass
+
+@dataclass(slots=True)
 class QualityReport:
     """Quality assessment report for a dataset"""
 
@@ -56,17 +58,21 @@ def check_required_fields(
     records: list[dict], required_fields: list[str]
 ) -> tuple[bool, dict]:
     """Check if all required fields are present in records"""
-    missing_by_record = []
+    records_with_missing = 0
+    sample_issues = []
     for idx, record in enumerate(records):
-        missing = [f for f in required_fields if f not in record or record[f] is None]
+        # A missing key and an explicit None both read back as None
+        missing = [f for f in required_fields if record.get(f) is None]
         if missing:
-            missing_by_record.append({"record_index": idx, "missing_fields": missing})
+            records_with_missing += 1
+            if len(sample_issues) < 5:
+                sample_issues.append({"record_index": idx, "missing_fields": missing})
 
-    passed = len(missing_by_record) == 0
+    passed = records_with_missing == 0
     details = {
         "required_fields": required_fields,
-        "records_with_missing": len(missing_by_record),
-        "sample_issues": missing_by_record[:5],
+        "records_with_missing": records_with_missing,
+        "sample_issues": sample_issues,
     }
     return passed, details
 
@@ -81,10 +87,12 @@ def check_null_percentage(
     total_fields = 0
     null_fields = 0
 
+    empty_values = (None, "", [])
+
     for record in records:
-        for key, value in record.items():
-            total_fields += 1
-            if value is None or value == "" or value == []:
+        total_fields += len(record)
+        for value in record.values():
+            if value in empty_values:
                 null_fields += 1
 
     null_pct = (null_fields / total_fields * 100) if total_fields > 0 else 0
@@ -99,18 +107,25 @@ def check_null_percentage(
 
 
 def check_duplicates(
-    records: list[dict], id_field: str = "id"
+    records: list[dict],
+    id_field: str = "id",
+    max_dup_pct: float = QA_THRESHOLDS["max_duplicate_percentage"],
 ) -> tuple[bool, dict]:
     """Check for duplicate records based on ID field"""
     if not records:
         return True, {"duplicate_count": 0, "duplicate_percentage": 0}
 
-    ids = [r.get(id_field) for r in records if r.get(id_field)]
-    unique_ids = set(ids)
-    duplicate_count = len(ids) - len(unique_ids)
+    ids = [record_id for r in records if (record_id := r.get(id_field))]
+    duplicate_count = len(ids) - len(set(ids))
     duplicate_pct = (duplicate_count / len(ids) * 100) if ids else 0
 
-    max_dup_pct = QA_THRESHOLDS["max_duplicate_percentage"]
+    # Only walk the IDs again when there is something to report
+    sample_duplicates = []
+    if duplicate_count:
+        sample_duplicates = [
+            record_id for record_id, count in Counter(ids).items() if count > 1
+        ][:5]
+
     passed = duplicate_pct <= max_dup_pct
 
     return passed, {
@@ -118,6 +133,7 @@ def check_duplicates(
         "duplicate_percentage": round(duplicate_pct, 2),
         "threshold": max_dup_pct,
         "total_records": len(records),
+        "sample_duplicates": sample_duplicates,
     }
 
 
@@ -152,24 +168,23 @@ def check_date_sequence(
     invalid_sequences = []
 
     for idx, record in enumerate(records):
-        dates = []
+        prev_field = prev_date = None
         for field_name in date_fields:
             date_val = record.get(field_name)
-            if date_val:
-                try:
-                    parsed = datetime.fromisoformat(
-                        date_val.replace("Z", "+00:00")
-                    )
-                    dates.append((field_name, parsed))
-                except (ValueError, AttributeError):
-                    pass
-
-        for i in range(len(dates) - 1):
-            if dates[i][1] > dates[i + 1][1]:
+            if not date_val:
+                continue
+            try:
+                # fromisoformat accepts a trailing "Z" as of Python 3.11
+                parsed = datetime.fromisoformat(date_val)
+            except (TypeError, ValueError):
+                continue
+
+            if prev_date is not None and prev_date > parsed:
                 invalid_sequences.append(
-                    {"index": idx, "field1": dates[i][0], "field2": dates[i + 1][0]}
+                    {"index": idx, "field1": prev_field, "field2": field_name}
                 )
                 break
+            prev_field, prev_date = field_name, parsed
 
     passed = len(invalid_sequences) == 0
     return passed, {
@@ -209,11 +224,19 @@ def check_enum_values(
     records: list[dict], field_name: str, valid_values: list[str]
 ) -> tuple[bool, dict]:
     """Check that field values are from allowed enumeration"""
+    allowed = frozenset(valid_values)
     invalid_values = []
 
     for idx, record in enumerate(records):
         value = record.get(field_name)
-        if value is not None and value not in valid_values:
+        if value is None:
+            continue
+        try:
+            valid = value in allowed
+        except TypeError:
+            # Unhashable values (lists, dicts) can't be in the set; compare against the list
+            valid = value in valid_values
+        if not valid:
             invalid_values.append({"index": idx, "value": value})
 
     passed = len(invalid_values) == 0
@@ -229,14 +252,11 @@ def check_email_format(
     records: list[dict], email_field: str = "Email__c"
 ) -> tuple[bool, dict]:
     """Basic email format validation"""
-    import re
-
-    email_pattern = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
-
+    match = EMAIL_PATTERN.match
     invalid_emails = []
     for idx, record in enumerate(records):
         email = record.get(email_field)
-        if email and not email_pattern.match(email):
+        if email and not match(email):
             invalid_emails.append({"index": idx, "email": email})
 
     passed = len(invalid_emails) == 0
@@ -600,21 +620,21 @@ def validate_claims(data: dict, policies_data: dict = None) -> QualityReport:
     return report
 
 
+VALIDATORS = {
+    "customers": validate_customers,
+    "agents": validate_agents,
+    "quotes": validate_quotes,
+    "applications": validate_applications,
+    "policies": validate_policies,
+    "claims": validate_claims,
+}
+
+
 def run_validation(data_file: Path, dataset_type: str) -> QualityReport:
     """Run validation on a data file"""
-    with open(data_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    validators = {
-        "customers": validate_customers,
-        "agents": validate_agents,
-        "quotes": validate_quotes,
-        "applications": validate_applications,
-        "policies": validate_policies,
-        "claims": validate_claims,
-    }
+    data = read_json(data_file)
 
-    validator = validators.get(dataset_type)
+    validator = VALIDATORS.get(dataset_type)
     if validator:
         return validator(data)
     else:
@@ -2,24 +2,35 @@
 Main Pipeline Runner for Life Insurance Data Lake
 Orchestrates the full ETL pipeline: Generate -> QA -> Validate -> PROD -> Dashboard
 """
-import json
+from bisect import bisect_left, bisect_right
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from pipelines.extract.life_insurance_generator import run_extraction as extract_life_insurance
 from pipelines.transform.promote import promote_all
-from config.settings import BASE_DIR, PROD_DIR
+from pipelines.io_utils import dumps_json, ensure_dir, read_json
+from config.settings import BASE_DIR, PROD_DIR, LIFE_INSURANCE_CONFIG
 
+# Dashboard bucket labels with their upper edges (ages inclusive, premiums exclusive)
+AGE_BUCKETS = ("18-30", "31-40", "41-50", "51-60", "61+")
+AGE_BUCKET_EDGES = (30, 40, 50, 60)
+PREMIUM_BUCKETS = ("0-100", "100-250", "250-500", "500-1000", "1000+")
+PREMIUM_BUCKET_EDGES = (100, 250, 500, 1000)
 
-def run_full_pipeline(num_customers: int = 100) -> dict:
+
+def run_full_pipeline(
+    num_customers: int = 100, workers: int = 1, pretty: bool = False
+) -> dict:
     """
     Run the complete Life Insurance ETL pipeline
 
     Args:
         num_customers: Number of customers to generate
+        workers: Worker processes for customer generation
+        pretty: Write QA extracts fully indented instead of one record per line
 
     Returns:
         Pipeline execution results
@@ -38,7 +49,14 @@ def run_full_pipeline(num_customers: int = 100) -> dict:
     # Step 1: Generate life insurance data
     print("\n[STEP 1/3] Generating life insurance data...")
     try:
-        extraction_files = extract_life_insurance(num_customers)
+        # Imported here so dashboard-only callers don't pay for loading Faker
+        from pipelines.extract.life_insurance_generator import (
+            run_extraction as extract_life_insurance,
+        )
+
+        extraction_files = extract_life_insurance(
+            num_customers, pretty=pretty, workers=workers
+        )
         results["extraction"] = {
             "success": True,
             "files": {k: str(v) for k, v in extraction_files.items()},
@@ -51,8 +69,10 @@ def run_full_pipeline(num_customers: int = 100) -> dict:
 
     # Step 2: Validate and promote to PROD
     print("\n[STEP 2/3] Validating and promoting to PROD layer...")
+    # Filled by promote_all so the dashboard step reuses the promoted data
+    prod_data = {}
     try:
-        promotion_results = promote_all()
+        promotion_results = promote_all(prod_cache=prod_data)
         results["promotion"] = promotion_results
         for pr in promotion_results:
             if not pr["success"]:
@@ -65,7 +85,7 @@ def run_full_pipeline(num_customers: int = 100) -> dict:
     # Step 3: Generate dashboard data
     print("\n[STEP 3/3] Generating dashboard data...")
     try:
-        generate_dashboard_data()
+        generate_dashboard_data(prod_data)
     except Exception as e:
         print(f"Dashboard data generation failed: {e}")
         results["dashboard_error"] = str(e)
@@ -83,8 +103,16 @@ def run_full_pipeline(num_customers: int = 100) -> dict:
     return results
 
 
-def generate_dashboard_data():
-    """Generate aggregated data for the life insurance dashboard"""
+def generate_dashboard_data(prod_data: dict | None = None):
+    """
+    Generate aggregated data for the life insurance dashboard
+
+    Args:
+        prod_data: PROD documents already in memory, keyed by entity type.
+            Entities not present are read from their *_latest.json file. Each
+            entity is removed from this dict once summarized, so its records
+            can be freed before the next entity is processed.
+    """
     dashboard_data = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "summary": {},
@@ -96,261 +124,35 @@ def generate_dashboard_data():
         "funnel": None,
     }
 
-    # Load all entities
-    entities = {}
     entity_types = ["customers", "agents", "quotes", "applications", "policies", "claims"]
-
-    for entity in entity_types:
-        file_path = PROD_DIR / entity / f"{entity}_latest.json"
-        if file_path.exists():
-            with open(file_path, "r") as f:
-                entities[entity] = json.load(f).get("data", [])
-
-    # Summary counts
-    dashboard_data["summary"] = {
-        "total_customers": len(entities.get("customers", [])),
-        "total_agents": len(entities.get("agents", [])),
-        "total_quotes": len(entities.get("quotes", [])),
-        "total_applications": len(entities.get("applications", [])),
-        "total_policies": len(entities.get("policies", [])),
-        "total_claims": len(entities.get("claims", [])),
+    entity_analytics = {
+        "customers": _customer_analytics,
+        "quotes": _quote_analytics,
+        "applications": _application_analytics,
+        "policies": _policy_analytics,
+        "claims": _claim_analytics,
     }
 
-    # Customers analytics
-    if "customers" in entities:
-        customers = entities["customers"]
-        dashboard_data["customers"] = {
-            "total_count": len(customers),
-            "by_gender": {},
-            "by_employment": {},
-            "smoker_count": 0,
-            "age_distribution": {"18-30": 0, "31-40": 0, "41-50": 0, "51-60": 0, "61+": 0},
-            "avg_income": 0,
-        }
-
-        total_income = 0
-        for c in customers:
-            gender = c.get("Gender__c", "Unknown")
-            dashboard_data["customers"]["by_gender"][gender] = (
-                dashboard_data["customers"]["by_gender"].get(gender, 0) + 1
-            )
-
-            emp = c.get("Employment_Status__c", "Unknown")
-            dashboard_data["customers"]["by_employment"][emp] = (
-                dashboard_data["customers"]["by_employment"].get(emp, 0) + 1
-            )
-
-            if c.get("Smoker__c"):
-                dashboard_data["customers"]["smoker_count"] += 1
-
-            age = c.get("Age__c", 0)
-            if age <= 30:
-                dashboard_data["customers"]["age_distribution"]["18-30"] += 1
-            elif age <= 40:
-                dashboard_data["customers"]["age_distribution"]["31-40"] += 1
-            elif age <= 50:
-                dashboard_data["customers"]["age_distribution"]["41-50"] += 1
-            elif age <= 60:
-                dashboard_data["customers"]["age_distribution"]["51-60"] += 1
-            else:
-                dashboard_data["customers"]["age_distribution"]["61+"] += 1
-
-            total_income += c.get("Annual_Income__c", 0)
-
-        if customers:
-            dashboard_data["customers"]["avg_income"] = round(total_income / len(customers), 2)
-
-    # Quotes analytics
-    if "quotes" in entities:
-        quotes = entities["quotes"]
-        dashboard_data["quotes"] = {
-            "total_count": len(quotes),
-            "by_product_type": {},
-            "by_status": {},
-            "by_source": {},
-            "avg_coverage": 0,
-            "avg_premium": 0,
-        }
-
-        total_coverage = 0
-        total_premium = 0
-
-        for q in quotes:
-            pt = q.get("Product_Type__c", "Unknown")
-            dashboard_data["quotes"]["by_product_type"][pt] = (
-                dashboard_data["quotes"]["by_product_type"].get(pt, 0) + 1
-            )
-
-            status = q.get("Status__c", "Unknown")
-            dashboard_data["quotes"]["by_status"][status] = (
-                dashboard_data["quotes"]["by_status"].get(status, 0) + 1
-            )
-
-            source = q.get("Source__c", "Unknown")
-            dashboard_data["quotes"]["by_source"][source] = (
-                dashboard_data["quotes"]["by_source"].get(source, 0) + 1
-            )
-
-            total_coverage += q.get("Coverage_Amount__c", 0)
-            total_premium += q.get("Premium_Monthly__c", 0)
-
-        if quotes:
-            dashboard_data["quotes"]["avg_coverage"] = round(total_coverage / len(quotes), 2)
-            dashboard_data["quotes"]["avg_premium"] = round(total_premium / len(quotes), 2)
-
-    # Applications analytics
-    if "applications" in entities:
-        apps = entities["applications"]
-        dashboard_data["applications"] = {
-            "total_count": len(apps),
-            "by_underwriting_status": {},
-            "by_health_class": {},
-            "approval_rate": 0,
-            "avg_risk_score": 0,
-            "medical_exam_required_pct": 0,
-        }
-
-        approved_count = 0
-        total_risk = 0
-        medical_required = 0
-
-        for a in apps:
-            status = a.get("Underwriting_Status__c", "Unknown")
-            dashboard_data["applications"]["by_underwriting_status"][status] = (
-                dashboard_data["applications"]["by_underwriting_status"].get(status, 0) + 1
-            )
-
-            if status == "Approved":
-                approved_count += 1
-
-            hc = a.get("Health_Class__c", "Unknown")
-            dashboard_data["applications"]["by_health_class"][hc] = (
-                dashboard_data["applications"]["by_health_class"].get(hc, 0) + 1
-            )
-
-            total_risk += a.get("Risk_Score__c", 0)
-
-            if a.get("Medical_Exam_Required__c"):
-                medical_required += 1
-
-        if apps:
-            dashboard_data["applications"]["approval_rate"] = round(
-                approved_count / len(apps) * 100, 1
-            )
-            dashboard_data["applications"]["avg_risk_score"] = round(total_risk / len(apps), 1)
-            dashboard_data["applications"]["medical_exam_required_pct"] = round(
-                medical_required / len(apps) * 100, 1
-            )
-
-    # Policies analytics
-    if "policies" in entities:
-        policies = entities["policies"]
-        dashboard_data["policies"] = {
-            "total_count": len(policies),
-            "by_status": {},
-            "by_product_type": {},
-            "by_payment_frequency": {},
-            "total_coverage": 0,
-            "total_premium_annual": 0,
-            "premium_distribution": {
-                "0-100": 0,
-                "100-250": 0,
-                "250-500": 0,
-                "500-1000": 0,
-                "1000+": 0,
-            },
-        }
-
-        for p in policies:
-            status = p.get("Status__c", "Unknown")
-            dashboard_data["policies"]["by_status"][status] = (
-                dashboard_data["policies"]["by_status"].get(status, 0) + 1
-            )
-
-            pt = p.get("Product_Type__c", "Unknown")
-            dashboard_data["policies"]["by_product_type"][pt] = (
-                dashboard_data["policies"]["by_product_type"].get(pt, 0) + 1
-            )
-
-            pf = p.get("Payment_Frequency__c", "Unknown")
-            dashboard_data["policies"]["by_payment_frequency"][pf] = (
-                dashboard_data["policies"]["by_payment_frequency"].get(pf, 0) + 1
-            )
-
-            dashboard_data["policies"]["total_coverage"] += p.get("Coverage_Amount__c", 0)
-
-            premium = p.get("Premium_Amount__c", 0)
-            freq = p.get("Payment_Frequency__c", "Monthly")
-            divisors = {"Monthly": 1, "Quarterly": 3, "Semi-Annual": 6, "Annual": 12}
-            monthly_premium = premium / divisors.get(freq, 1)
-
-            if monthly_premium < 100:
-                dashboard_data["policies"]["premium_distribution"]["0-100"] += 1
-            elif monthly_premium < 250:
-                dashboard_data["policies"]["premium_distribution"]["100-250"] += 1
-            elif monthly_premium < 500:
-                dashboard_data["policies"]["premium_distribution"]["250-500"] += 1
-            elif monthly_premium < 1000:
-                dashboard_data["policies"]["premium_distribution"]["500-1000"] += 1
-            else:
-                dashboard_data["policies"]["premium_distribution"]["1000+"] += 1
-
-    # Claims analytics
-    if "claims" in entities:
-        claims = entities["claims"]
-        dashboard_data["claims"] = {
-            "total_count": len(claims),
-            "by_type": {},
-            "by_status": {},
-            "total_claimed": 0,
-            "total_paid": 0,
-            "avg_processing_days": 0,
-            "approval_rate": 0,
-        }
-
-        processing_days_total = 0
-        claims_with_dates = 0
-        approved_claims = 0
-
-        for c in claims:
-            ctype = c.get("Claim_Type__c", "Unknown")
-            dashboard_data["claims"]["by_type"][ctype] = (
-                dashboard_data["claims"]["by_type"].get(ctype, 0) + 1
-            )
-
-            status = c.get("Status__c", "Unknown")
-            dashboard_data["claims"]["by_status"][status] = (
-                dashboard_data["claims"]["by_status"].get(status, 0) + 1
-            )
-
-            if status in ["Approved", "Paid", "Closed"]:
-                approved_claims += 1
-
-            dashboard_data["claims"]["total_claimed"] += c.get("Claim_Amount__c", 0)
-            dashboard_data["claims"]["total_paid"] += c.get("Payout_Amount__c", 0) or 0
-
-            if c.get("Filed_Date__c") and c.get("Processed_Date__c"):
-                filed = datetime.fromisoformat(c["Filed_Date__c"])
-                processed = datetime.fromisoformat(c["Processed_Date__c"])
-                processing_days_total += (processed - filed).days
-                claims_with_dates += 1
-
-        if claims_with_dates:
-            dashboard_data["claims"]["avg_processing_days"] = round(
-                processing_days_total / claims_with_dates, 1
-            )
-
-        if claims:
-            dashboard_data["claims"]["approval_rate"] = round(
-                approved_claims / len(claims) * 100, 1
-            )
+    # Load and summarize one entity at a time so only one record list is held
+    counts = {}
+    dashboard_data["summary"] = {f"total_{entity}": 0 for entity in entity_types}
+    for entity in entity_types:
+        records = _load_prod_records(entity, prod_data)
+        if records is None:
+            continue
+        counts[entity] = len(records)
+        dashboard_data["summary"][f"total_{entity}"] = len(records)
+        if entity in entity_analytics:
+            dashboard_data[entity] = entity_analytics[entity](records)
+        # Release this list before the next entity is loaded
+        records = None
 
     # Conversion funnel
     dashboard_data["funnel"] = {
-        "quotes": len(entities.get("quotes", [])),
-        "applications": len(entities.get("applications", [])),
-        "policies": len(entities.get("policies", [])),
-        "claims": len(entities.get("claims", [])),
+        "quotes": counts.get("quotes", 0),
+        "applications": counts.get("applications", 0),
+        "policies": counts.get("policies", 0),
+        "claims": counts.get("claims", 0),
         "conversion_rates": {
             "quote_to_application": 0,
             "application_to_policy": 0,
@@ -384,14 +186,183 @@ def generate_dashboard_data():
 
     # Save dashboard data
     output_file = BASE_DIR / "docs" / "assets" / "data" / "dashboard_data.json"
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_file, "w") as f:
-        json.dump(dashboard_data, f, indent=2)
+    ensure_dir(output_file.parent)
+    output_file.write_bytes(dumps_json(dashboard_data))
 
     print(f"Dashboard data saved to: {output_file}")
 
 
+def _load_prod_records(entity: str, prod_data: dict | None) -> list[dict] | None:
+    """Return an entity's PROD records from memory (removing them) or disk, or None if none"""
+    if prod_data and entity in prod_data:
+        return prod_data.pop(entity).get("data", [])
+    file_path = PROD_DIR / entity / f"{entity}_latest.json"
+    if file_path.exists():
+        return read_json(file_path).get("data", [])
+    return None
+
+
+def _customer_analytics(customers: list[dict]) -> dict:
+    """Customers section of the dashboard"""
+    stats = {
+        "total_count": len(customers),
+        "by_gender": Counter(c.get("Gender__c", "Unknown") for c in customers),
+        "by_employment": Counter(
+            c.get("Employment_Status__c", "Unknown") for c in customers
+        ),
+        "smoker_count": 0,
+        "age_distribution": {},
+        "avg_income": 0,
+    }
+
+    smoker_count = 0
+    age_counts = [0] * len(AGE_BUCKETS)
+    total_income = 0
+    for c in customers:
+        if c.get("Smoker__c"):
+            smoker_count += 1
+        age_counts[bisect_left(AGE_BUCKET_EDGES, c.get("Age__c", 0))] += 1
+        total_income += c.get("Annual_Income__c", 0)
+
+    stats["smoker_count"] = smoker_count
+    stats["age_distribution"] = dict(zip(AGE_BUCKETS, age_counts))
+    if customers:
+        stats["avg_income"] = round(total_income / len(customers), 2)
+
+    return stats
+
+
+def _quote_analytics(quotes: list[dict]) -> dict:
+    """Quotes section of the dashboard"""
+    stats = {
+        "total_count": len(quotes),
+        "by_product_type": Counter(q.get("Product_Type__c", "Unknown") for q in quotes),
+        "by_status": Counter(q.get("Status__c", "Unknown") for q in quotes),
+        "by_source": Counter(q.get("Source__c", "Unknown") for q in quotes),
+        "avg_coverage": 0,
+        "avg_premium": 0,
+    }
+
+    total_coverage = 0
+    total_premium = 0
+
+    for q in quotes:
+        total_coverage += q.get("Coverage_Amount__c", 0)
+        total_premium += q.get("Premium_Monthly__c", 0)
+
+    if quotes:
+        stats["avg_coverage"] = round(total_coverage / len(quotes), 2)
+        stats["avg_premium"] = round(total_premium / len(quotes), 2)
+
+    return stats
+
+
+def _application_analytics(apps: list[dict]) -> dict:
+    """Applications section of the dashboard"""
+    stats = {
+        "total_count": len(apps),
+        "by_underwriting_status": Counter(
+            a.get("Underwriting_Status__c", "Unknown") for a in apps
+        ),
+        "by_health_class": Counter(a.get("Health_Class__c", "Unknown") for a in apps),
+        "approval_rate": 0,
+        "avg_risk_score": 0,
+        "medical_exam_required_pct": 0,
+    }
+
+    approved_count = stats["by_underwriting_status"]["Approved"]
+    total_risk = 0
+    medical_required = 0
+
+    for a in apps:
+        total_risk += a.get("Risk_Score__c", 0)
+
+        if a.get("Medical_Exam_Required__c"):
+            medical_required += 1
+
+    if apps:
+        stats["approval_rate"] = round(approved_count / len(apps) * 100, 1)
+        stats["avg_risk_score"] = round(total_risk / len(apps), 1)
+        stats["medical_exam_required_pct"] = round(medical_required / len(apps) * 100, 1)
+
+    return stats
+
+
+def _policy_analytics(policies: list[dict]) -> dict:
+    """Policies section of the dashboard"""
+    stats = {
+        "total_count": len(policies),
+        "by_status": Counter(p.get("Status__c", "Unknown") for p in policies),
+        "by_product_type": Counter(p.get("Product_Type__c", "Unknown") for p in policies),
+        "by_payment_frequency": Counter(
+            p.get("Payment_Frequency__c", "Unknown") for p in policies
+        ),
+        "total_coverage": 0,
+        "total_premium_annual": 0,
+        "premium_distribution": {},
+    }
+
+    total_coverage = 0
+    premium_counts = [0] * len(PREMIUM_BUCKETS)
+    # Premiums are normalized to monthly before bucketing
+    payment_months = LIFE_INSURANCE_CONFIG["payment_frequency_months"]
+    for p in policies:
+        total_coverage += p.get("Coverage_Amount__c", 0)
+
+        premium = p.get("Premium_Amount__c", 0)
+        freq = p.get("Payment_Frequency__c", "Monthly")
+        monthly_premium = premium / payment_months.get(freq, 1)
+        premium_counts[bisect_right(PREMIUM_BUCKET_EDGES, monthly_premium)] += 1
+
+    stats["total_coverage"] = total_coverage
+    stats["premium_distribution"] = dict(zip(PREMIUM_BUCKETS, premium_counts))
+
+    return stats
+
+
+def _claim_analytics(claims: list[dict]) -> dict:
+    """Claims section of the dashboard"""
+    stats = {
+        "total_count": len(claims),
+        "by_type": Counter(c.get("Claim_Type__c", "Unknown") for c in claims),
+        "by_status": Counter(c.get("Status__c", "Unknown") for c in claims),
+        "total_claimed": 0,
+        "total_paid": 0,
+        "avg_processing_days": 0,
+        "approval_rate": 0,
+    }
+
+    claims_by_status = stats["by_status"]
+    approved_claims = sum(claims_by_status[s] for s in ("Approved", "Paid", "Closed"))
+    total_claimed = 0
+    total_paid = 0
+    processing_days_total = 0
+    claims_with_dates = 0
+
+    for c in claims:
+        total_claimed += c.get("Claim_Amount__c", 0)
+        total_paid += c.get("Payout_Amount__c", 0) or 0
+
+        filed_date = c.get("Filed_Date__c")
+        processed_date = c.get("Processed_Date__c")
+        if filed_date and processed_date:
+            filed = datetime.fromisoformat(filed_date)
+            processed = datetime.fromisoformat(processed_date)
+            processing_days_total += (processed - filed).days
+            claims_with_dates += 1
+
+    stats["total_claimed"] = total_claimed
+    stats["total_paid"] = total_paid
+
+    if claims_with_dates:
+        stats["avg_processing_days"] = round(processing_days_total / claims_with_dates, 1)
+
+    if claims:
+        stats["approval_rate"] = round(approved_claims / len(claims) * 100, 1)
+
+    return stats
+
+
 if __name__ == "__main__":
     import argparse
 
@@ -399,6 +370,12 @@ if __name__ == "__main__":
     parser.add_argument(
         "--customers", type=int, default=100, help="Number of customers to generate"
     )
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Worker processes for customer generation"
+    )
+    parser.add_argument(
+        "--pretty", action="store_true", help="Write fully indented QA extracts"
+    )
     args = parser.parse_args()
 
-    run_full_pipeline(args.customers)
+    run_full_pipeline(args.customers, workers=args.workers, pretty=args.pretty)
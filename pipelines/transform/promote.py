@@ -2,13 +2,14 @@
 Data Promotion Pipeline for Life Insurance Data Lake
 Promotes validated data from QA to PROD layer
 """
-import json
 from datetime import datetime, timezone
 from pathlib import Path
+import os
 import sys
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from config.settings import QA_DIR, PROD_DIR, LIFE_INSURANCE_ENTITIES
+from pipelines.io_utils import ensure_dir, read_json, read_json_metadata, write_json_records
 from pipelines.quality_checks.validators import (
     QualityReport,
     validate_customers,
@@ -19,6 +20,24 @@ from pipelines.quality_checks.validators import (
     validate_claims,
 )
 
+# Field each entity's PROD records are sorted by
+ID_FIELDS = {
+    "customers": "Customer_ID__c",
+    "agents": "Agent_ID__c",
+    "quotes": "Quote_ID__c",
+    "applications": "Application_ID__c",
+    "policies": "Policy_ID__c",
+    "claims": "Claim_ID__c",
+}
+
+# PROD entity each entity is validated against
+PARENT_ENTITIES = {
+    "quotes": "customers",
+    "applications": "quotes",
+    "policies": "applications",
+    "claims": "policies",
+}
+
 
 def get_latest_qa_file(dataset_type: str) -> Path | None:
     """Get the most recent file from QA layer"""
@@ -26,8 +45,13 @@ def get_latest_qa_file(dataset_type: str) -> Path | None:
     if not qa_path.exists():
         return None
 
-    files = sorted(qa_path.glob("*.json"), key=lambda x: x.stat().st_mtime, reverse=True)
-    return files[0] if files else None
+    with os.scandir(qa_path) as entries:
+        latest = max(
+            (e for e in entries if e.name.endswith(".json") and e.is_file()),
+            key=lambda e: e.stat().st_mtime,
+            default=None,
+        )
+    return Path(latest.path) if latest else None
 
 
 def get_latest_prod_file(dataset_type: str) -> Path | None:
@@ -36,48 +60,81 @@ def get_latest_prod_file(dataset_type: str) -> Path | None:
     return prod_file if prod_file.exists() else None
 
 
-def load_prod_data(dataset_type: str) -> dict | None:
-    """Load data from PROD layer for FK validation"""
+def load_prod_data(dataset_type: str, prod_cache: dict | None = None) -> dict | None:
+    """Load data from PROD layer for FK validation, preferring a copy promoted this run"""
+    if prod_cache is not None and dataset_type in prod_cache:
+        return prod_cache[dataset_type]
     prod_file = get_latest_prod_file(dataset_type)
     if prod_file:
-        with open(prod_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return read_json(prod_file)
     return None
 
 
-def clean_data(data: dict, dataset_type: str) -> dict:
-    """Clean and transform data for PROD layer"""
-    records = data.get("data", [])
-    cleaned_records = []
-
-    id_fields = {
-        "customers": "Customer_ID__c",
-        "agents": "Agent_ID__c",
-        "quotes": "Quote_ID__c",
-        "applications": "Application_ID__c",
-        "policies": "Policy_ID__c",
-        "claims": "Claim_ID__c",
-    }
+def load_prod_metadata(dataset_type: str, prod_cache: dict | None = None) -> dict | None:
+    """
+    Load only the metadata of an entity's PROD file, preferring a copy promoted this run
+
+    Returns None when there is no PROD file or it cannot be read or parsed.
+    """
+    if prod_cache is not None and dataset_type in prod_cache:
+        return prod_cache[dataset_type]["metadata"]
+    prod_file = get_latest_prod_file(dataset_type)
+    if not prod_file:
+        return None
+    try:
+        return read_json_metadata(prod_file)
+    except (OSError, ValueError):
+        return None
 
-    for record in records:
-        cleaned = {k: v for k, v in record.items() if v is not None and v != ""}
 
-        # Standardize string fields
-        for key, value in cleaned.items():
-            if isinstance(value, str):
-                cleaned[key] = value.strip()
+def is_unchanged(
+    dataset_type: str, qa_file: Path, qa_mtime_ns: int, prod_cache: dict | None = None
+) -> bool:
+    """
+    Check whether the current PROD file can be kept as-is
 
-        cleaned_records.append(cleaned)
+    It must have been built and validated from this same QA file (matched by
+    name and mtime), against the parent PROD that is current now (matched by
+    the parent's promoted_at).
+    """
+    metadata = load_prod_metadata(dataset_type, prod_cache)
+    if not metadata or metadata.get("validated") is not True:
+        return False
+    if (
+        metadata.get("qa_source_file") != qa_file.name
+        or metadata.get("qa_source_mtime_ns") != qa_mtime_ns
+    ):
+        return False
+
+    parent_type = PARENT_ENTITIES.get(dataset_type)
+    parent_metadata = load_prod_metadata(parent_type, prod_cache) if parent_type else None
+    parent_promoted_at = parent_metadata.get("promoted_at") if parent_metadata else None
+    return metadata.get("parent_promoted_at") == parent_promoted_at
+
+
+def clean_data(data: dict, dataset_type: str, promoted_at: str | None = None) -> dict:
+    """Clean and transform data for PROD layer, stamped with promoted_at (default: now)"""
+    records = data.get("data", [])
+
+    # Drop empty values and standardize string fields in one pass per record
+    cleaned_records = [
+        {
+            k: v.strip() if isinstance(v, str) else v
+            for k, v in record.items()
+            if v is not None and v != ""
+        }
+        for record in records
+    ]
 
     # Sort by ID
-    id_field = id_fields.get(dataset_type, "id")
+    id_field = ID_FIELDS.get(dataset_type, "id")
     cleaned_records.sort(key=lambda x: x.get(id_field, ""))
 
     return {
         "metadata": {
             "source": data["metadata"]["source"],
             "qa_extracted_at": data["metadata"]["extracted_at"],
-            "promoted_at": datetime.now(timezone.utc).isoformat(),
+            "promoted_at": promoted_at or datetime.now(timezone.utc).isoformat(),
             "record_count": len(cleaned_records),
             "layer": "PROD",
         },
@@ -85,13 +142,22 @@ def clean_data(data: dict, dataset_type: str) -> dict:
     }
 
 
-def promote_to_prod(dataset_type: str, force: bool = False) -> dict:
+def promote_to_prod(
+    dataset_type: str,
+    force: bool = False,
+    prod_cache: dict | None = None,
+    skip_unchanged: bool = False,
+) -> dict:
     """
     Promote data from QA to PROD layer with validation
 
     Args:
         dataset_type: Entity type to promote
         force: Skip validation if True
+        prod_cache: PROD data promoted earlier in this run, keyed by entity type.
+            Parents are read from here before disk, and the promoted data is added.
+        skip_unchanged: Keep the current PROD file if it was validated from this
+            same QA file against the current parent PROD (see is_unchanged)
 
     Returns:
         Dictionary with promotion results
@@ -112,26 +178,43 @@ def promote_to_prod(dataset_type: str, force: bool = False) -> dict:
         return result
 
     result["qa_file"] = str(qa_file)
+    qa_mtime_ns = qa_file.stat().st_mtime_ns
+
+    if skip_unchanged and is_unchanged(dataset_type, qa_file, qa_mtime_ns, prod_cache):
+        prod_file = get_latest_prod_file(dataset_type)
+        try:
+            current = read_json(prod_file)
+        except (OSError, ValueError):
+            current = None
+        if current is not None:
+            if prod_cache is not None:
+                prod_cache[dataset_type] = current
+            result["prod_file"] = str(prod_file)
+            result["success"] = True
+            result["skipped"] = True
+            result["record_count"] = current["metadata"].get("record_count", 0)
+            print(f"PROD already built from {qa_file.name}, skipping {dataset_type}")
+            return result
+
     print(f"Processing QA file: {qa_file}")
 
     # Load QA data
-    with open(qa_file, "r", encoding="utf-8") as f:
-        qa_data = json.load(f)
+    qa_data = read_json(qa_file)
 
     # Run validation unless forced
+    validated = False
+    parent_promoted_at = None
     if not force:
         print(f"Running quality checks on {dataset_type}...")
 
         # Load parent data for FK validation
         parent_data = {}
-        if dataset_type == "quotes":
-            parent_data["customers"] = load_prod_data("customers")
-        elif dataset_type == "applications":
-            parent_data["quotes"] = load_prod_data("quotes")
-        elif dataset_type == "policies":
-            parent_data["applications"] = load_prod_data("applications")
-        elif dataset_type == "claims":
-            parent_data["policies"] = load_prod_data("policies")
+        parent_type = PARENT_ENTITIES.get(dataset_type)
+        if parent_type:
+            parent_prod = load_prod_data(parent_type, prod_cache)
+            parent_data[parent_type] = parent_prod
+            if parent_prod:
+                parent_promoted_at = parent_prod["metadata"].get("promoted_at")
 
         # Run appropriate validator
         validators = {
@@ -153,20 +236,24 @@ def promote_to_prod(dataset_type: str, force: bool = False) -> dict:
                 print(f"Validation FAILED: {report.errors}")
                 return result
 
+            validated = True
             print(f"Validation PASSED with {len(report.warnings)} warnings")
         else:
             print(f"No validator found for {dataset_type}, skipping validation")
 
     # Clean and promote
-    prod_data = clean_data(qa_data, dataset_type)
+    prod_data = clean_data(qa_data, dataset_type, promoted_at=result["timestamp"])
+    prod_data["metadata"]["qa_source_file"] = qa_file.name
+    prod_data["metadata"]["qa_source_mtime_ns"] = qa_mtime_ns
+    prod_data["metadata"]["validated"] = validated
+    prod_data["metadata"]["parent_promoted_at"] = parent_promoted_at
 
     # Save to PROD
-    prod_dir = PROD_DIR / dataset_type
-    prod_dir.mkdir(parents=True, exist_ok=True)
+    prod_dir = ensure_dir(PROD_DIR / dataset_type)
     prod_file = prod_dir / f"{dataset_type}_latest.json"
-
-    with open(prod_file, "w", encoding="utf-8") as f:
-        json.dump(prod_data, f, indent=2)
+    write_json_records(prod_file, prod_data["metadata"], prod_data["data"])
+    if prod_cache is not None:
+        prod_cache[dataset_type] = prod_data
 
     result["prod_file"] = str(prod_file)
     result["success"] = True
@@ -176,18 +263,28 @@ def promote_to_prod(dataset_type: str, force: bool = False) -> dict:
     return result
 
 
-def promote_all(force: bool = False) -> list[dict]:
+def promote_all(force: bool = False, prod_cache: dict | None = None) -> list[dict]:
     """
     Promote all life insurance entities from QA to PROD
-    Entities are promoted in dependency order
+    Entities are promoted in dependency order. An entity already validated
+    from its current QA file against its current parent PROD is skipped.
+
+    Args:
+        force: Skip validation if True (also disables skipping unchanged entities)
+        prod_cache: Optional dict filled with each promoted entity's PROD data
     """
     results = []
+    # Promoted data is kept so child entities validate FKs without re-reading PROD
+    if prod_cache is None:
+        prod_cache = {}
 
     for dataset_type in LIFE_INSURANCE_ENTITIES:
         print(f"\n{'='*50}")
         print(f"Promoting {dataset_type}...")
         print(f"{'='*50}")
-        result = promote_to_prod(dataset_type, force=force)
+        result = promote_to_prod(
+            dataset_type, force=force, prod_cache=prod_cache, skip_unchanged=not force
+        )
         results.append(result)
 
         # Stop if a critical entity fails (maintains referential integrity)
@@ -222,6 +319,8 @@ if __name__ == "__main__":
     print("=" * 50)
     for r in results:
         status = "SUCCESS" if r["success"] else "FAILED"
+        if r.get("skipped"):
+            status += " (unchanged, skipped)"
         print(f"{r['dataset_type']}: {status}")
         if r.get("error"):
             print(f"  Error: {r['error']}")
@@ -0,0 +1,47 @@
+"""
+Tests for the data quality validators
+"""
+from pathlib import Path
+import sys
+import unittest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from pipelines.quality_checks.validators import check_enum_values, validate_quotes
+
+
+class CheckEnumValuesTest(unittest.TestCase):
+    def test_valid_values_pass(self):
+        records = [{"Status__c": "Active"}, {"Status__c": "Lapsed"}, {"Status__c": None}]
+        passed, details = check_enum_values(records, "Status__c", ["Active", "Lapsed"])
+        self.assertTrue(passed)
+        self.assertEqual(details["invalid_count"], 0)
+
+    def test_unhashable_values_are_invalid(self):
+        records = [
+            {"Status__c": ["Active"]},
+            {"Status__c": {"value": "Active"}},
+            {"Status__c": "Active"},
+        ]
+        passed, details = check_enum_values(records, "Status__c", ["Active", "Lapsed"])
+        self.assertFalse(passed)
+        self.assertEqual(details["invalid_count"], 2)
+        self.assertEqual([d["index"] for d in details["sample_invalid"]], [0, 1])
+
+    def test_list_valued_field_fails_validation_without_raising(self):
+        data = {
+            "data": [
+                {
+                    "Quote_ID__c": "Q-1",
+                    "Customer_ID__c": "C-1",
+                    "Product_Type__c": ["Term Life"],
+                }
+            ]
+        }
+        report = validate_quotes(data)
+        checks = {check["name"]: check for check in report.checks}
+        self.assertFalse(checks["valid_product_types"]["passed"])
+        self.assertEqual(checks["valid_product_types"]["details"]["invalid_count"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()